@@ -2,9 +2,10 @@
 from homeassistant.components.weather import WeatherEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PRESSURE_HPA, SPEED_KILOMETERS_PER_HOUR, TEMP_CELSIUS
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_API_CONDITION,
@@ -21,7 +22,7 @@ from .const import (
     FORECAST_MODE_DAILY,
     FORECAST_MODES,
 )
-from .weather_update_coordinator import WeatherUpdateCoordinator
+from .weather_update_coordinator import WEATHER_STALE_TIMEOUT, WeatherUpdateCoordinator
 
 
 async def async_setup_entry(
@@ -33,14 +34,15 @@ async def async_setup_entry(
     domain_data = hass.data[DOMAIN][config_entry.entry_id]
     weather_coordinator = domain_data[ENTRY_WEATHER_COORDINATOR]
 
-    entities = []
-    for mode in FORECAST_MODES:
-        name = f"{domain_data[ENTRY_NAME]} {mode}"
-        unique_id = f"{config_entry.unique_id} {mode}"
-        entities.append(AemetWeather(name, unique_id, weather_coordinator, mode))
-
-    if entities:
-        async_add_entities(entities, False)
+    async_add_entities(
+        AemetWeather(
+            f"{domain_data[ENTRY_NAME]} {mode}",
+            f"{config_entry.unique_id} {mode}",
+            weather_coordinator,
+            mode,
+        )
+        for mode in FORECAST_MODES
+    )
 
 
 class AemetWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
@@ -60,44 +62,39 @@ class AemetWeather(CoordinatorEntity[WeatherUpdateCoordinator], WeatherEntity):
     ):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._forecast_mode = forecast_mode
+        self._forecast_key = FORECAST_MODE_ATTR_API[forecast_mode]
         self._attr_entity_registry_enabled_default = (
-            self._forecast_mode == FORECAST_MODE_DAILY
+            forecast_mode == FORECAST_MODE_DAILY
         )
         self._attr_name = name
         self._attr_unique_id = unique_id
+        self._async_update_attrs()
 
     @property
-    def condition(self):
-        """Return the current condition."""
-        return self.coordinator.data[ATTR_API_CONDITION]
-
-    @property
-    def forecast(self):
-        """Return the forecast array."""
-        return self.coordinator.data[FORECAST_MODE_ATTR_API[self._forecast_mode]]
-
-    @property
-    def humidity(self):
-        """Return the humidity."""
-        return self.coordinator.data[ATTR_API_HUMIDITY]
-
-    @property
-    def pressure(self):
-        """Return the pressure."""
-        return self.coordinator.data[ATTR_API_PRESSURE]
-
-    @property
-    def temperature(self):
-        """Return the temperature."""
-        return self.coordinator.data[ATTR_API_TEMPERATURE]
-
-    @property
-    def wind_bearing(self):
-        """Return the wind bearing."""
-        return self.coordinator.data[ATTR_API_WIND_BEARING]
+    def available(self) -> bool:
+        """Return if entity is available, allowing for short AEMET outages."""
+        if self.coordinator.last_update_success:
+            return True
+        last_success = self.coordinator.last_update_success_time
+        return (
+            last_success is not None
+            and dt_util.utcnow() - last_success < WEATHER_STALE_TIMEOUT
+        )
 
-    @property
-    def wind_speed(self):
-        """Return the wind speed."""
-        return self.coordinator.data[ATTR_API_WIND_SPEED]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes when the coordinator updates."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update weather attributes."""
+        data = self.coordinator.data
+        self._attr_condition = data[ATTR_API_CONDITION]
+        self._attr_forecast = data[self._forecast_key]
+        self._attr_humidity = data[ATTR_API_HUMIDITY]
+        self._attr_pressure = data[ATTR_API_PRESSURE]
+        self._attr_temperature = data[ATTR_API_TEMPERATURE]
+        self._attr_wind_bearing = data[ATTR_API_WIND_BEARING]
+        self._attr_wind_speed = data[ATTR_API_WIND_SPEED]
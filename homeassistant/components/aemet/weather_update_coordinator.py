@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
 
 from aemet_opendata.const import (
@@ -86,6 +86,7 @@ _LOGGER = logging.getLogger(__name__)
 
 STATION_MAX_DELTA = timedelta(hours=2)
 WEATHER_UPDATE_INTERVAL = timedelta(minutes=10)
+WEATHER_STALE_TIMEOUT = timedelta(minutes=30)
 
 
 def format_condition(condition: str) -> str:
@@ -137,12 +138,14 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
             "hourly": None,
             "station": None,
         }
+        self.last_update_success_time: datetime | None = None
 
     async def _async_update_data(self):
         data = {}
         async with async_timeout.timeout(120):
             weather_response = await self._get_aemet_weather()
         data = self._convert_weather_response(weather_response)
+        self.last_update_success_time = dt_util.utcnow()
         return data
 
     async def _get_aemet_weather(self):
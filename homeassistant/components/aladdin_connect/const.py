@@ -1,6 +1,7 @@
 """Platform for the Aladdin Connect cover component."""
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Final
 
 from homeassistant.components.cover import CoverEntityFeature
@@ -18,3 +19,10 @@ STATES_MAP: Final[dict[str, str]] = {
 
 DOMAIN = "aladdin_connect"
 SUPPORTED_FEATURES: Final = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
+UPDATE_INTERVAL: Final = timedelta(seconds=30)
+UPDATE_INTERVAL_ACTIVE: Final = timedelta(seconds=10)
+UPDATE_INTERVAL_IDLE: Final = timedelta(seconds=90)
+UPDATE_INTERVAL_FAST: Final = timedelta(seconds=5)
+IDLE_THRESHOLD: Final = 120
+FAST_POLL_DURATION: Final = 60
+STALE_DATA_TIMEOUT: Final = 300
@@ -0,0 +1,100 @@
+"""DataUpdateCoordinator for the Aladdin Connect integration."""
+from __future__ import annotations
+
+import logging
+from time import monotonic
+from typing import Final
+
+from aladdin_connect import AladdinConnectClient
+from requests.exceptions import RequestException
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    DOMAIN,
+    FAST_POLL_DURATION,
+    IDLE_THRESHOLD,
+    STALE_DATA_TIMEOUT,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_ACTIVE,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_IDLE,
+)
+from .model import DoorDevice
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+def door_key(door: DoorDevice) -> str:
+    """Return the key identifying a door in the coordinator data."""
+    return f"{door['device_id']}-{door['door_number']}"
+
+
+class AladdinConnectDataUpdateCoordinator(DataUpdateCoordinator[dict[str, DoorDevice]]):
+    """Fetch the state of all Aladdin Connect doors in a single request.
+
+    The polling interval adapts to activity: it is shortened after a door
+    changes state or a command is issued, and lengthened once the doors
+    have been idle for a while. A failed poll drops back to the regular
+    interval and keeps the last known door states for a short while before
+    the doors are marked unavailable.
+    """
+
+    def __init__(self, hass: HomeAssistant, acc: AladdinConnectClient) -> None:
+        """Initialize the Aladdin Connect coordinator."""
+        self.acc = acc
+        self._last_change = monotonic()
+        self._fast_poll_until = 0.0
+        self._last_success = 0.0
+        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=UPDATE_INTERVAL)
+
+    async def _async_update_data(self) -> dict[str, DoorDevice]:
+        """Fetch all doors from Aladdin Connect."""
+        try:
+            doors = await self.hass.async_add_executor_job(self.acc.get_doors)
+            if not doors and self.data:
+                # The library returns no doors instead of raising on API errors
+                raise ValueError("No doors returned by Aladdin Connect")
+        except (TypeError, KeyError, NameError, ValueError, RequestException) as ex:
+            # Don't keep polling a failing API at the fast or active rate
+            self._fast_poll_until = 0.0
+            if self.update_interval != UPDATE_INTERVAL_IDLE:
+                self.update_interval = UPDATE_INTERVAL
+            if (
+                self.data is not None
+                and monotonic() - self._last_success < STALE_DATA_TIMEOUT
+            ):
+                _LOGGER.debug("Using cached door states after error: %s", ex)
+                return self.data
+            raise UpdateFailed(ex) from ex
+
+        self._last_success = monotonic()
+        data = {door_key(door): door for door in doors}
+        self._adjust_update_interval(data)
+        return data
+
+    def _adjust_update_interval(self, data: dict[str, DoorDevice]) -> None:
+        """Pick the next polling interval based on recent door activity."""
+        now = monotonic()
+        if self.data is not None and _door_states(data) != _door_states(self.data):
+            self._last_change = now
+            self.update_interval = UPDATE_INTERVAL_ACTIVE
+
+        if now < self._fast_poll_until:
+            self.update_interval = UPDATE_INTERVAL_FAST
+        elif now - self._last_change > IDLE_THRESHOLD:
+            self.update_interval = UPDATE_INTERVAL_IDLE
+        elif self.update_interval == UPDATE_INTERVAL_FAST:
+            self.update_interval = UPDATE_INTERVAL_ACTIVE
+
+    async def async_trigger_fast_poll(self, duration: int = FAST_POLL_DURATION) -> None:
+        """Poll quickly for a while so a door movement is picked up promptly."""
+        self._fast_poll_until = monotonic() + duration
+        self.update_interval = UPDATE_INTERVAL_FAST
+        await self.async_request_refresh()
+
+
+def _door_states(data: dict[str, DoorDevice]) -> dict[str, str | None]:
+    """Return the status of each door."""
+    return {key: door.get("status") for key, door in data.items()}
@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 from typing import Any, Final
 
-from aladdin_connect import AladdinConnectClient
 import voluptuous as vol
 
 from homeassistant.components.cover import (
@@ -20,13 +19,14 @@ from homeassistant.const import (
     STATE_CLOSING,
     STATE_OPENING,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, STATES_MAP, SUPPORTED_FEATURES
+from .coordinator import AladdinConnectDataUpdateCoordinator, door_key
 from .model import DoorDevice
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -62,47 +62,61 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Aladdin Connect platform."""
-    acc = hass.data[DOMAIN][config_entry.entry_id]
-    try:
-        doors = await hass.async_add_executor_job(acc.get_doors)
-
-    except (TypeError, KeyError, NameError, ValueError) as ex:
-        _LOGGER.error("%s", ex)
-        raise ConfigEntryNotReady from ex
+    coordinator: AladdinConnectDataUpdateCoordinator = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
 
     async_add_entities(
-        (AladdinDevice(acc, door) for door in doors),
-        update_before_add=True,
+        AladdinDevice(coordinator, door) for door in coordinator.data.values()
     )
 
 
-class AladdinDevice(CoverEntity):
+class AladdinDevice(
+    CoordinatorEntity[AladdinConnectDataUpdateCoordinator], CoverEntity
+):
     """Representation of Aladdin Connect cover."""
 
     _attr_device_class = CoverDeviceClass.GARAGE
     _attr_supported_features = SUPPORTED_FEATURES
 
-    def __init__(self, acc: AladdinConnectClient, device: DoorDevice) -> None:
+    def __init__(
+        self, coordinator: AladdinConnectDataUpdateCoordinator, device: DoorDevice
+    ) -> None:
         """Initialize the Aladdin Connect cover."""
-        self._acc = acc
+        super().__init__(coordinator)
+        self._acc = coordinator.acc
         self._device_id = device["device_id"]
         self._number = device["door_number"]
+        self._door_key = door_key(device)
         self._attr_name = device["name"]
-        self._attr_unique_id = f"{self._device_id}-{self._number}"
+        self._attr_unique_id = self._door_key
+        self._async_update_attrs()
 
-    def close_cover(self, **kwargs: Any) -> None:
+    async def async_close_cover(self, **kwargs: Any) -> None:
         """Issue close command to cover."""
-        self._acc.close_door(self._device_id, self._number)
+        await self.hass.async_add_executor_job(
+            self._acc.close_door, self._device_id, self._number
+        )
+        await self.coordinator.async_trigger_fast_poll()
 
-    def open_cover(self, **kwargs: Any) -> None:
+    async def async_open_cover(self, **kwargs: Any) -> None:
         """Issue open command to cover."""
-        self._acc.open_door(self._device_id, self._number)
-
-    def update(self) -> None:
-        """Update status of cover."""
-        status = STATES_MAP.get(
-            self._acc.get_door_status(self._device_id, self._number)
+        await self.hass.async_add_executor_job(
+            self._acc.open_door, self._device_id, self._number
         )
+        await self.coordinator.async_trigger_fast_poll()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes when the coordinator updates."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update cover attributes."""
+        door = self.coordinator.data.get(self._door_key)
+        status = None if door is None else STATES_MAP.get(door["status"])
         self._attr_is_opening = status == STATE_OPENING
         self._attr_is_closing = status == STATE_CLOSING
         self._attr_is_closed = None if status is None else status == STATE_CLOSED
@@ -1,6 +1,7 @@
 """The Synology DSM component."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any
@@ -26,7 +27,7 @@ from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .common import SynoApi
+from .common import SynoApi, camera_source_signal
 from .const import (
     COORDINATOR_CAMERAS,
     COORDINATOR_CENTRAL,
@@ -36,8 +37,9 @@ from .const import (
     DOMAIN,
     EXCEPTION_DETAILS,
     EXCEPTION_UNKNOWN,
+    MAX_CONCURRENT_SNAPSHOTS,
     PLATFORMS,
-    SIGNAL_CAMERA_SOURCE_CHANGED,
+    SNAPSHOT_SEMAPHORE,
     SYNO_API,
     SYSTEM_LOADED,
     UNDO_UPDATE_LISTENER,
@@ -102,6 +104,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         UNDO_UPDATE_LISTENER: entry.add_update_listener(_async_update_listener),
         SYNO_API: api,
         SYSTEM_LOADED: True,
+        SNAPSHOT_SEMAPHORE: asyncio.Semaphore(MAX_CONCURRENT_SNAPSHOTS),
     }
 
     # Services
@@ -114,9 +117,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             entry, data={**entry.data, CONF_MAC: network.macs}
         )
 
-    async def async_coordinator_update_data_cameras() -> dict[
-        str, dict[str, SynoCamera]
-    ] | None:
+    async def async_coordinator_update_data_cameras() -> dict[str, SynoCamera] | None:
         """Fetch all camera data from api."""
         if not hass.data[DOMAIN][entry.unique_id][SYSTEM_LOADED]:
             raise UpdateFailed("System not fully loaded")
@@ -146,11 +147,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             ):
                 async_dispatcher_send(
                     hass,
-                    f"{SIGNAL_CAMERA_SOURCE_CHANGED}_{entry.entry_id}_{cam_id}",
+                    camera_source_signal(entry.entry_id, cam_id),
                     cam_data_new.live_view.rtsp,
                 )
 
-        return {"cameras": new_data}
+        return new_data
 
     async def async_coordinator_update_data_central() -> None:
         """Fetch all device and sensor data from api."""
@@ -1,8 +1,10 @@
 """Support for Synology DSM cameras."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import logging
+from time import monotonic
 
 from synology_dsm.api.surveillance_station import SynoCamera, SynoSurveillanceStation
 from synology_dsm.exceptions import (
@@ -23,12 +25,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import SynoApi
+from .common import camera_source_signal
 from .const import (
     CONF_SNAPSHOT_QUALITY,
     COORDINATOR_CAMERAS,
     DEFAULT_SNAPSHOT_QUALITY,
     DOMAIN,
-    SIGNAL_CAMERA_SOURCE_CHANGED,
+    SNAPSHOT_CACHE_TTL,
+    SNAPSHOT_SEMAPHORE,
     SYNO_API,
 )
 from .entity import SynologyDSMBaseEntity, SynologyDSMEntityDescription
@@ -55,14 +59,25 @@ async def async_setup_entry(
         return
 
     # initial data fetch
-    coordinator: DataUpdateCoordinator[dict[str, dict[str, SynoCamera]]] = data[
+    coordinator: DataUpdateCoordinator[dict[str, SynoCamera]] = data[
         COORDINATOR_CAMERAS
     ]
     await coordinator.async_config_entry_first_refresh()
 
+    snapshot_quality = entry.options.get(
+        CONF_SNAPSHOT_QUALITY, DEFAULT_SNAPSHOT_QUALITY
+    )
     async_add_entities(
-        SynoDSMCamera(api, coordinator, camera_id)
-        for camera_id in coordinator.data["cameras"]
+        SynoDSMCamera(
+            api,
+            coordinator,
+            entry.entry_id,
+            camera_id,
+            camera,
+            snapshot_quality,
+            data[SNAPSHOT_SEMAPHORE],
+        )
+        for camera_id, camera in coordinator.data.items()
     )
 
 
@@ -70,67 +85,74 @@ class SynoDSMCamera(SynologyDSMBaseEntity, Camera):
     """Representation a Synology camera."""
 
     _attr_supported_features = CameraEntityFeature.STREAM
-    coordinator: DataUpdateCoordinator[dict[str, dict[str, SynoCamera]]]
+    coordinator: DataUpdateCoordinator[dict[str, SynoCamera]]
     entity_description: SynologyDSMCameraEntityDescription
+    _camera: SynoCamera
 
     def __init__(
         self,
         api: SynoApi,
-        coordinator: DataUpdateCoordinator[dict[str, dict[str, SynoCamera]]],
+        coordinator: DataUpdateCoordinator[dict[str, SynoCamera]],
+        entry_id: str,
         camera_id: str,
+        camera: SynoCamera,
+        snapshot_quality: int,
+        snapshot_semaphore: asyncio.Semaphore,
     ) -> None:
         """Initialize a Synology camera."""
         description = SynologyDSMCameraEntityDescription(
             api_key=SynoSurveillanceStation.CAMERA_API_KEY,
             key=camera_id,
-            name=coordinator.data["cameras"][camera_id].name,
-            entity_registry_enabled_default=coordinator.data["cameras"][
-                camera_id
-            ].is_enabled,
-        )
-        self.snapshot_quality = api._entry.options.get(
-            CONF_SNAPSHOT_QUALITY, DEFAULT_SNAPSHOT_QUALITY
+            name=camera.name,
+            entity_registry_enabled_default=camera.is_enabled,
         )
+        self.snapshot_quality = snapshot_quality
+        self._snapshot_semaphore = snapshot_semaphore
+        self._snapshot_cache: tuple[float, bytes] | None = None
+        self._snapshot_task: asyncio.Task[bytes | None] | None = None
         super().__init__(api, coordinator, description)
         Camera.__init__(self)
+        self._async_update_attrs()
+        self._source_signal = camera_source_signal(entry_id, camera.id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{api.information.serial}_{camera.id}")},
+            name=camera.name,
+            model=camera.model,
+            via_device=(
+                DOMAIN,
+                f"{api.information.serial}_{SynoSurveillanceStation.INFO_API_KEY}",
+            ),
+        )
 
     @property
     def camera_data(self) -> SynoCamera:
         """Camera data."""
-        return self.coordinator.data["cameras"][self.entity_description.key]
+        return self._camera
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        return DeviceInfo(
-            identifiers={
-                (
-                    DOMAIN,
-                    f"{self._api.information.serial}_{self.camera_data.id}",
-                )
-            },
-            name=self.camera_data.name,
-            model=self.camera_data.model,
-            via_device=(
-                DOMAIN,
-                f"{self._api.information.serial}_{SynoSurveillanceStation.INFO_API_KEY}",
-            ),
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes when the coordinator updates."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update camera attributes."""
+        if (camera := self.coordinator.data.get(self.entity_description.key)) is None:
+            # Camera was removed from Surveillance Station
+            self._attr_available = False
+            return
+        self._camera = camera
+        self._attr_available = (
+            camera.is_enabled and self.coordinator.last_update_success
         )
+        self._attr_is_recording = camera.is_recording
+        self._attr_motion_detection_enabled = camera.is_motion_detection_enabled
 
     @property
     def available(self) -> bool:
         """Return the availability of the camera."""
-        return self.camera_data.is_enabled and self.coordinator.last_update_success
-
-    @property
-    def is_recording(self) -> bool:
-        """Return true if the device is recording."""
-        return self.camera_data.is_recording  # type: ignore[no-any-return]
-
-    @property
-    def motion_detection_enabled(self) -> bool:
-        """Return the camera motion detection status."""
-        return self.camera_data.is_motion_detection_enabled  # type: ignore[no-any-return]
+        return self._attr_available
 
     def _listen_source_updates(self) -> None:
         """Listen for camera source changed events."""
@@ -141,32 +163,48 @@ class SynoDSMCamera(SynologyDSMBaseEntity, Camera):
                 _LOGGER.debug("Update stream URL for camera %s", self.camera_data.name)
                 self.stream.update_source(url)
 
-        assert self.platform
-        assert self.platform.config_entry
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{SIGNAL_CAMERA_SOURCE_CHANGED}_{self.platform.config_entry.entry_id}_{self.camera_data.id}",
-                _handle_signal,
-            )
+            async_dispatcher_connect(self.hass, self._source_signal, _handle_signal)
         )
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to signal."""
         self._listen_source_updates()
+        await super().async_added_to_hass()
 
-    def camera_image(
+    async def async_camera_image(
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image."""
+        if not self._attr_available:
+            return None
         _LOGGER.debug(
             "SynoDSMCamera.camera_image(%s)",
             self.camera_data.name,
         )
-        if not self.available:
-            return None
+
+        if (cache := self._snapshot_cache) is not None and (
+            monotonic() - cache[0] < SNAPSHOT_CACHE_TTL
+        ):
+            return cache[1]
+
+        # Concurrent requests for the same camera share a single fetch
+        if self._snapshot_task is None:
+            self._snapshot_task = self.hass.async_create_task(
+                self._async_fetch_camera_image()
+            )
+        return await asyncio.shield(self._snapshot_task)
+
+    async def _async_fetch_camera_image(self) -> bytes | None:
+        """Fetch a snapshot from the NAS and cache it."""
         try:
-            return self._api.surveillance_station.get_camera_image(self.entity_description.key, self.snapshot_quality)  # type: ignore[no-any-return]
+            # Limit the number of snapshots requested from the NAS at once
+            async with self._snapshot_semaphore:
+                image: bytes | None = await self.hass.async_add_executor_job(
+                    self._api.surveillance_station.get_camera_image,
+                    self.entity_description.key,
+                    self.snapshot_quality,
+                )
         except (
             SynologyDSMAPIErrorException,
             SynologyDSMRequestException,
@@ -178,6 +216,12 @@ class SynoDSMCamera(SynologyDSMBaseEntity, Camera):
                 err,
             )
             return None
+        finally:
+            self._snapshot_task = None
+
+        if image is not None:
+            self._snapshot_cache = (monotonic(), image)
+        return image
 
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
@@ -190,22 +234,26 @@ class SynoDSMCamera(SynologyDSMBaseEntity, Camera):
 
         return self.camera_data.live_view.rtsp  # type: ignore[no-any-return]
 
-    def enable_motion_detection(self) -> None:
+    async def async_enable_motion_detection(self) -> None:
         """Enable motion detection in the camera."""
         _LOGGER.debug(
             "SynoDSMCamera.enable_motion_detection(%s)",
             self.camera_data.name,
         )
-        self._api.surveillance_station.enable_motion_detection(
-            self.entity_description.key
+        await self.hass.async_add_executor_job(
+            self._api.surveillance_station.enable_motion_detection,
+            self.entity_description.key,
         )
+        await self.coordinator.async_request_refresh()
 
-    def disable_motion_detection(self) -> None:
+    async def async_disable_motion_detection(self) -> None:
         """Disable motion detection in camera."""
         _LOGGER.debug(
             "SynoDSMCamera.disable_motion_detection(%s)",
             self.camera_data.name,
         )
-        self._api.surveillance_station.disable_motion_detection(
-            self.entity_description.key
+        await self.hass.async_add_executor_job(
+            self._api.surveillance_station.disable_motion_detection,
+            self.entity_description.key,
         )
+        await self.coordinator.async_request_refresh()
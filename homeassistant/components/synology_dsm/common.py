@@ -33,11 +33,21 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 
-from .const import CONF_DEVICE_TOKEN, DOMAIN, SYSTEM_LOADED
+from .const import (
+    CONF_DEVICE_TOKEN,
+    DOMAIN,
+    SIGNAL_CAMERA_SOURCE_CHANGED,
+    SYSTEM_LOADED,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
+def camera_source_signal(entry_id: str, camera_id: int | str) -> str:
+    """Return the signal sent when the stream source of a camera changes."""
+    return f"{SIGNAL_CAMERA_SOURCE_CHANGED}_{entry_id}_{camera_id}"
+
+
 class SynoApi:
     """Class to interface with Synology DSM API."""
 
@@ -24,6 +24,7 @@ EXCEPTION_UNKNOWN = "unknown"
 
 # Entry keys
 SYNO_API = "syno_api"
+SNAPSHOT_SEMAPHORE = "snapshot_semaphore"
 UNDO_UPDATE_LISTENER = "undo_update_listener"
 
 # Configuration
@@ -40,6 +41,8 @@ DEFAULT_PORT_SSL = 5001
 DEFAULT_SCAN_INTERVAL = 15  # min
 DEFAULT_TIMEOUT = 10  # sec
 DEFAULT_SNAPSHOT_QUALITY = SNAPSHOT_PROFILE_BALANCED
+MAX_CONCURRENT_SNAPSHOTS = 5
+SNAPSHOT_CACHE_TTL = 1  # sec
 
 ENTITY_UNIT_LOAD = "load"
 
@@ -26,9 +26,7 @@ class SynologyDSMEntityDescription(EntityDescription, SynologyDSMRequiredKeysMix
     """Generic Synology DSM entity description."""
 
 
-class SynologyDSMBaseEntity(
-    CoordinatorEntity[DataUpdateCoordinator[dict[str, dict[str, Any]]]]
-):
+class SynologyDSMBaseEntity(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]]):
     """Representation of a Synology NAS entry."""
 
     entity_description: SynologyDSMEntityDescription
@@ -38,7 +36,7 @@ class SynologyDSMBaseEntity(
     def __init__(
         self,
         api: SynoApi,
-        coordinator: DataUpdateCoordinator[dict[str, dict[str, Any]]],
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
         description: SynologyDSMEntityDescription,
     ) -> None:
         """Initialize the Synology DSM entity."""
@@ -73,7 +71,7 @@ class SynologyDSMDeviceEntity(SynologyDSMBaseEntity):
     def __init__(
         self,
         api: SynoApi,
-        coordinator: DataUpdateCoordinator[dict[str, dict[str, Any]]],
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
         description: SynologyDSMEntityDescription,
         device_id: str | None = None,
     ) -> None:
@@ -1,8 +1,16 @@
 """The sensor tests for the AEMET OpenData platform."""
 
+from datetime import timedelta
 from unittest.mock import patch
 
-from homeassistant.components.aemet.const import ATTRIBUTION
+from homeassistant.components.aemet.const import (
+    ATTRIBUTION,
+    DOMAIN,
+    ENTRY_WEATHER_COORDINATOR,
+)
+from homeassistant.components.aemet.weather_update_coordinator import (
+    WEATHER_STALE_TIMEOUT,
+)
 from homeassistant.components.weather import (
     ATTR_CONDITION_PARTLYCLOUDY,
     ATTR_CONDITION_SNOWY,
@@ -21,7 +29,8 @@ from homeassistant.components.weather import (
     ATTR_WEATHER_WIND_BEARING,
     ATTR_WEATHER_WIND_SPEED,
 )
-from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.const import ATTR_ATTRIBUTION, STATE_UNAVAILABLE
+from homeassistant.helpers.update_coordinator import UpdateFailed
 import homeassistant.util.dt as dt_util
 
 from .util import async_init_integration
@@ -61,3 +70,46 @@ async def test_aemet_weather(hass):
 
     state = hass.states.get("weather.aemet_hourly")
     assert state is None
+
+
+async def test_aemet_weather_stale(hass):
+    """Test the weather stays available during short AEMET outages."""
+
+    hass.config.set_time_zone("UTC")
+    now = dt_util.parse_datetime("2021-01-09 12:00:00+00:00")
+    with patch("homeassistant.util.dt.now", return_value=now), patch(
+        "homeassistant.util.dt.utcnow", return_value=now
+    ):
+        await async_init_integration(hass)
+
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    coordinator = hass.data[DOMAIN][entry.entry_id][ENTRY_WEATHER_COORDINATOR]
+
+    with patch(
+        "homeassistant.components.aemet.weather_update_coordinator.WeatherUpdateCoordinator._get_aemet_weather",
+        side_effect=UpdateFailed,
+    ), patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=now + WEATHER_STALE_TIMEOUT - timedelta(minutes=1),
+    ):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert not coordinator.last_update_success
+    state = hass.states.get("weather.aemet_daily")
+    assert state
+    assert state.state == ATTR_CONDITION_SNOWY
+
+    with patch(
+        "homeassistant.components.aemet.weather_update_coordinator.WeatherUpdateCoordinator._get_aemet_weather",
+        side_effect=UpdateFailed,
+    ), patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=now + WEATHER_STALE_TIMEOUT + timedelta(minutes=1),
+    ):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    state = hass.states.get("weather.aemet_daily")
+    assert state
+    assert state.state == STATE_UNAVAILABLE
@@ -164,6 +164,9 @@ async def test_import_flow_success(hass: HomeAssistant) -> None:
     ), patch(
         "homeassistant.components.aladdin_connect.config_flow.AladdinConnectClient.login",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[],
     ), patch(
         "homeassistant.components.aladdin_connect.cover.async_setup_entry",
         return_value=True,
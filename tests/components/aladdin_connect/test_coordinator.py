@@ -0,0 +1,160 @@
+"""Test the Aladdin Connect coordinator."""
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.aladdin_connect.const import (
+    STALE_DATA_TIMEOUT,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_ACTIVE,
+    UPDATE_INTERVAL_FAST,
+    UPDATE_INTERVAL_IDLE,
+)
+from homeassistant.components.aladdin_connect.coordinator import (
+    AladdinConnectDataUpdateCoordinator,
+)
+from homeassistant.core import HomeAssistant
+
+DEVICE_CONFIG_OPEN = {
+    "device_id": 533255,
+    "door_number": 1,
+    "name": "home",
+    "status": "open",
+    "link_status": "Connected",
+}
+
+DEVICE_CONFIG_CLOSED = {
+    "device_id": 533255,
+    "door_number": 1,
+    "name": "home",
+    "status": "closed",
+    "link_status": "Connected",
+}
+
+DEVICE_CONFIG_CLOSING = {
+    "device_id": 533255,
+    "door_number": 1,
+    "name": "home",
+    "status": "closing",
+    "link_status": "Connected",
+}
+
+
+async def test_adaptive_update_interval(hass: HomeAssistant) -> None:
+    """Test the polling interval follows door activity."""
+    acc = MagicMock()
+    with patch(
+        "homeassistant.components.aladdin_connect.coordinator.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 0
+        coordinator = AladdinConnectDataUpdateCoordinator(hass, acc)
+        assert coordinator.update_interval == UPDATE_INTERVAL
+
+        # First fetch, nothing to compare against
+        mock_monotonic.return_value = 1
+        acc.get_doors.return_value = [DEVICE_CONFIG_CLOSED]
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL
+
+        # A door changed state
+        mock_monotonic.return_value = 2
+        acc.get_doors.return_value = [DEVICE_CONFIG_OPEN]
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_ACTIVE
+
+        # Still active shortly after the change
+        mock_monotonic.return_value = 60
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_ACTIVE
+
+        # Doors idle for longer than the threshold
+        mock_monotonic.return_value = 200
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_IDLE
+
+        # A command was issued
+        mock_monotonic.return_value = 300
+        await coordinator.async_trigger_fast_poll()
+        assert coordinator.update_interval == UPDATE_INTERVAL_FAST
+        assert acc.get_doors.call_count == 5
+
+        # Movement picked up while in the fast poll window
+        mock_monotonic.return_value = 310
+        acc.get_doors.return_value = [DEVICE_CONFIG_CLOSING]
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_FAST
+
+        # Fast poll window is over, the door changed recently
+        mock_monotonic.return_value = 370
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_ACTIVE
+
+        coordinator._debounced_refresh.async_cancel()
+
+
+async def test_no_doors_returned_uses_cached_data(hass: HomeAssistant) -> None:
+    """Test an empty door list is treated as a failed poll."""
+    acc = MagicMock()
+    with patch(
+        "homeassistant.components.aladdin_connect.coordinator.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 0
+        coordinator = AladdinConnectDataUpdateCoordinator(hass, acc)
+
+        acc.get_doors.return_value = [DEVICE_CONFIG_CLOSED]
+        await coordinator.async_refresh()
+        data = coordinator.data
+
+        # The API errored, the library swallowed it and returned no doors
+        mock_monotonic.return_value = STALE_DATA_TIMEOUT - 1
+        acc.get_doors.return_value = []
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.data == data
+
+        # The cached door states are too old
+        mock_monotonic.return_value = STALE_DATA_TIMEOUT + 1
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+
+        coordinator._debounced_refresh.async_cancel()
+
+
+async def test_failed_poll_backs_off(hass: HomeAssistant) -> None:
+    """Test a failed poll leaves the fast poll window."""
+    acc = MagicMock()
+    with patch(
+        "homeassistant.components.aladdin_connect.coordinator.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 0
+        coordinator = AladdinConnectDataUpdateCoordinator(hass, acc)
+
+        acc.get_doors.return_value = [DEVICE_CONFIG_CLOSED]
+        await coordinator.async_refresh()
+
+        mock_monotonic.return_value = 10
+        await coordinator.async_trigger_fast_poll()
+        assert coordinator.update_interval == UPDATE_INTERVAL_FAST
+
+        # The API fails inside the fast poll window
+        mock_monotonic.return_value = 15
+        acc.get_doors.return_value = []
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.update_interval == UPDATE_INTERVAL
+
+        # Recovering does not resume fast polling
+        mock_monotonic.return_value = 20
+        acc.get_doors.return_value = [DEVICE_CONFIG_CLOSED]
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL
+
+        # An idle coordinator stays idle while the API fails
+        mock_monotonic.return_value = 200
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_IDLE
+
+        mock_monotonic.return_value = 210
+        acc.get_doors.side_effect = ValueError
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == UPDATE_INTERVAL_IDLE
+
+        coordinator._debounced_refresh.async_cancel()
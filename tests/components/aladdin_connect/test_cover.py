@@ -1,4 +1,5 @@
 """Test the Aladdin Connect Cover."""
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -97,15 +98,16 @@ async def test_setup_get_doors_errors(
     )
     config_entry.add_to_hass(hass)
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
     ), patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         side_effect=side_effect,
     ):
-        assert await hass.config_entries.async_setup(config_entry.entry_id) is True
+        assert await hass.config_entries.async_setup(config_entry.entry_id) is False
         await hass.async_block_till_done()
         assert len(hass.states.async_all()) == 0
+        assert config_entry.state == ConfigEntryState.SETUP_RETRY
 
 
 @pytest.mark.parametrize(
@@ -126,7 +128,7 @@ async def test_setup_login_error(hass: HomeAssistant, side_effect: Exception) ->
     )
     config_entry.add_to_hass(hass)
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         side_effect=side_effect,
     ):
         assert await hass.config_entries.async_setup(config_entry.entry_id) is False
@@ -143,8 +145,11 @@ async def test_setup_component_noerror(hass: HomeAssistant) -> None:
     )
     config_entry.add_to_hass(hass)
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_CLOSED],
     ):
 
         assert await hass.config_entries.async_setup(config_entry.entry_id)
@@ -167,10 +172,10 @@ async def test_cover_operation(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
     ), patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_OPEN],
     ):
         assert await hass.config_entries.async_setup(config_entry.entry_id)
@@ -181,84 +186,124 @@ async def test_cover_operation(hass: HomeAssistant) -> None:
     assert COVER_DOMAIN in hass.config.components
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.open_door",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.open_door",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_OPENING],
     ):
         await hass.services.async_call(
             "cover", "open_cover", {"entity_id": "cover.home"}, blocking=True
         )
+        await hass.async_block_till_done()
+    assert hass.states.get("cover.home").state == STATE_OPENING
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.close_door",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.close_door",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_CLOSING],
     ):
         await hass.services.async_call(
             "cover", "close_cover", {"entity_id": "cover.home"}, blocking=True
         )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
+    assert hass.states.get("cover.home").state == STATE_CLOSING
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_CLOSED],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state == STATE_CLOSED
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_OPEN],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state == STATE_OPEN
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_OPENING],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state == STATE_OPENING
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_CLOSING],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state == STATE_CLOSING
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_BAD],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_BAD_NO_DOOR],
     ):
-        await hass.services.async_call(
-            "homeassistant", "update_entity", {"entity_id": "cover.home"}, blocking=True
-        )
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
     assert hass.states.get("cover.home").state
 
 
+@pytest.mark.parametrize(
+    "get_doors_kwargs",
+    [{"return_value": []}, {"side_effect": ValueError}],
+)
+async def test_cover_keeps_state_on_transient_error(
+    hass: HomeAssistant, get_doors_kwargs: dict[str, Any]
+) -> None:
+    """Test the last known door state is kept when a poll fails."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=YAML_CONFIG,
+        unique_id="test-id",
+    )
+    config_entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
+        return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_CLOSED],
+    ):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+    assert hass.states.get("cover.home").state == STATE_CLOSED
+
+    with patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        **get_doors_kwargs,
+    ):
+        await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+        await hass.async_block_till_done()
+    assert hass.states.get("cover.home").state == STATE_CLOSED
+
+
 async def test_yaml_import(hass: HomeAssistant, caplog: pytest.LogCaptureFixture):
     """Test setup YAML import."""
     assert COVER_DOMAIN not in hass.config.components
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
     ), patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.get_doors",
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
         return_value=[DEVICE_CONFIG_CLOSED],
     ):
         await cover.async_setup_platform(hass, YAML_CONFIG, None)
@@ -10,6 +10,14 @@ from tests.common import MockConfigEntry
 
 YAML_CONFIG = {"username": "test-user", "password": "test-password"}
 
+DEVICE_CONFIG_CLOSED = {
+    "device_id": 533255,
+    "door_number": 1,
+    "name": "home",
+    "status": "closed",
+    "link_status": "Connected",
+}
+
 
 async def test_unload_entry(hass: HomeAssistant):
     """Test successful unload of entry."""
@@ -20,8 +28,11 @@ async def test_unload_entry(hass: HomeAssistant):
     entry.add_to_hass(hass)
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_CLOSED],
     ):
 
         assert (await async_setup_component(hass, DOMAIN, entry)) is True
@@ -44,7 +55,7 @@ async def test_entry_password_fail(hass: HomeAssistant):
     entry.add_to_hass(hass)
 
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=False,
     ):
 
@@ -61,8 +72,11 @@ async def test_load_and_unload(hass: HomeAssistant) -> None:
     )
     config_entry.add_to_hass(hass)
     with patch(
-        "homeassistant.components.aladdin_connect.cover.AladdinConnectClient.login",
+        "homeassistant.components.aladdin_connect.AladdinConnectClient.login",
         return_value=True,
+    ), patch(
+        "homeassistant.components.aladdin_connect.coordinator.AladdinConnectClient.get_doors",
+        return_value=[DEVICE_CONFIG_CLOSED],
     ):
 
         await hass.config_entries.async_setup(config_entry.entry_id)
@@ -0,0 +1,106 @@
+"""Tests for the Synology DSM camera platform."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from synology_dsm.exceptions import SynologyDSMRequestException
+
+from homeassistant.components.synology_dsm.camera import SynoDSMCamera
+from homeassistant.components.synology_dsm.const import (
+    DEFAULT_SNAPSHOT_QUALITY,
+    MAX_CONCURRENT_SNAPSHOTS,
+    SNAPSHOT_CACHE_TTL,
+)
+from homeassistant.core import HomeAssistant
+
+from .consts import SERIAL
+
+CAMERA_ID = "1"
+IMAGE = b"image"
+
+
+def _create_camera(
+    hass: HomeAssistant, semaphore: asyncio.Semaphore | None = None
+) -> tuple[SynoDSMCamera, MagicMock]:
+    """Create a camera entity backed by a mocked API."""
+    api = MagicMock()
+    api.information.serial = SERIAL
+    syno_camera = MagicMock(id=CAMERA_ID, is_enabled=True)
+    syno_camera.name = "Camera"
+    coordinator = MagicMock(data={CAMERA_ID: syno_camera}, last_update_success=True)
+
+    camera = SynoDSMCamera(
+        api,
+        coordinator,
+        "entry_id",
+        CAMERA_ID,
+        syno_camera,
+        DEFAULT_SNAPSHOT_QUALITY,
+        semaphore or asyncio.Semaphore(MAX_CONCURRENT_SNAPSHOTS),
+    )
+    camera.hass = hass
+    return camera, api.surveillance_station.get_camera_image
+
+
+async def test_camera_image_shared_and_cached(hass: HomeAssistant) -> None:
+    """Test concurrent snapshot requests share one fetch and are cached."""
+    camera, get_camera_image = _create_camera(hass)
+    get_camera_image.return_value = IMAGE
+
+    with patch(
+        "homeassistant.components.synology_dsm.camera.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 0
+        assert await asyncio.gather(
+            camera.async_camera_image(), camera.async_camera_image()
+        ) == [IMAGE, IMAGE]
+        assert get_camera_image.call_count == 1
+        get_camera_image.assert_called_with(CAMERA_ID, DEFAULT_SNAPSHOT_QUALITY)
+
+        # Served from cache within the TTL
+        mock_monotonic.return_value = SNAPSHOT_CACHE_TTL / 2
+        assert await camera.async_camera_image() == IMAGE
+        assert get_camera_image.call_count == 1
+
+        # Cache expired, the NAS is unreachable
+        mock_monotonic.return_value = SNAPSHOT_CACHE_TTL + 1
+        get_camera_image.side_effect = SynologyDSMRequestException(
+            ConnectionError("unreachable")
+        )
+        assert await camera.async_camera_image() is None
+        assert get_camera_image.call_count == 2
+
+        # A failed fetch is not reused, the next request fetches again
+        get_camera_image.side_effect = None
+        get_camera_image.return_value = b"new image"
+        assert await camera.async_camera_image() == b"new image"
+        assert get_camera_image.call_count == 3
+
+
+async def test_camera_image_semaphore(hass: HomeAssistant) -> None:
+    """Test snapshots wait for a free slot on the NAS."""
+    semaphore = asyncio.Semaphore(1)
+    camera, get_camera_image = _create_camera(hass, semaphore)
+    get_camera_image.return_value = IMAGE
+
+    await semaphore.acquire()
+    task = asyncio.create_task(camera.async_camera_image())
+    # The fetch is queued behind the semaphore, so don't block till done
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert not task.done()
+    get_camera_image.assert_not_called()
+
+    semaphore.release()
+    assert await task == IMAGE
+    assert get_camera_image.call_count == 1
+
+
+async def test_camera_image_unavailable(hass: HomeAssistant) -> None:
+    """Test no snapshot is fetched for an unavailable camera."""
+    camera, get_camera_image = _create_camera(hass)
+    camera._attr_available = False
+
+    assert await camera.async_camera_image() is None
+    get_camera_image.assert_not_called()